@@ -14,10 +14,11 @@ from .sccd_api_handler.sccd_wo_connector import SCCD_WO
 from .sccd_api_handler.sccd_ci_configurator import SCCD_CI_Configurator as SCCD_CI_CONF
 from .sccd_api_handler.sccd_loc_connector import SCCD_LOC
 from .sccd_api_handler.sccd_sr_connector import SCCD_SR
+from .sccd_api_handler.sccd_result import BulkResult
 
 from .remote_access_handler import execute as nexus_remote_access
 
 
 __all__ = ["get_controller", "get_domains", "get_org", "get_meraki_switches", 
-           "SCCD_WO", "SCCD_CI_CONF", "SCCD_LOC", "SCCD_SR",
+           "SCCD_WO", "SCCD_CI_CONF", "SCCD_LOC", "SCCD_SR", "BulkResult",
            "nexus_remote_access"]
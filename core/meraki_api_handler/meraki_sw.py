@@ -19,6 +19,9 @@ as a list of dictionaries [{}, {}, ...]:
     - uplink lldp info: LLDP neighbor information on uplink
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import meraki
 
 
@@ -35,6 +38,14 @@ class MerakiSWinfo:
         switches (list): Processed list of switch information
     """
 
+    # Concurrent per-switch port requests. The Dashboard API allows about
+    # 10 requests/s per organization, and each request takes longer than
+    # 100 ms, so 4 workers stay under the limit. Any 429 responses that still
+    # happen are retried by the SDK (see MAX_RETRIES).
+    MAX_WORKERS = 4
+    # SDK retries on 429/5xx per request (the SDK default is 2)
+    MAX_RETRIES = 10
+
     def __init__(self):
         """Initialize the MerakiSWinfo instance with empty attributes."""
         self.API_KEY = None  # Meraki API KEY
@@ -42,13 +53,17 @@ class MerakiSWinfo:
         self.org_devices = None
         self.switches = []  # Switch information will be stored here
 
-    def get(self, API_KEY: str, org: str) -> list:
+    def get(self, API_KEY: str, org: str, max_workers: int = MAX_WORKERS) -> list:
         """
         Retrieve all switches from the organization with detailed port information.
 
+        Port information is requested for several switches at once.
+
         Args:
             API_KEY: Meraki Dashboard API key
             org: Organization ID to query
+            max_workers: Number of switches queried concurrently
+                         (1 = sequential, useful for debugging)
 
         Returns:
             list: List of dictionaries containing switch information, or None on error
@@ -57,7 +72,8 @@ class MerakiSWinfo:
         self.org = org
 
         # Get all devices from the organization
-        dashboard = meraki.DashboardAPI(self.API_KEY, output_log=False, print_console=False)
+        dashboard = meraki.DashboardAPI(self.API_KEY, output_log=False, print_console=False,
+                                        maximum_retries=self.MAX_RETRIES)
 
         try:
             self.org_devices = dashboard.organizations.getOrganizationDevicesStatuses(
@@ -70,54 +86,74 @@ class MerakiSWinfo:
 
         # Get information for all devices in the organization
         if self.org_devices:
-            for i, device in enumerate(self.org_devices):
-                # Check each device to identify switches
-                if device['productType'] == 'switch':
-                    serial = device['serial']
-                    # Request port status for this switch
-                    port_status = dashboard.switch.getDeviceSwitchPortsStatuses(serial)
-                    num_ports = len(port_status)  # Total number of ports
-                    ports_connected = 0
-                    uplink = None
-                    uplink_description = None
-                    lldp_info = None
-
-                    for i, port in enumerate(port_status):
-                        # Check each port and count connected ones
-                        if port['status'] == 'Connected':
-                            ports_connected += 1
-                        # Detect uplink port to get additional information
-                        if port['isUplink'] == True:
-                            print('###  UPLINK DETECTED  ###')
-                            print(f'###  port{port["portId"]} for {device["name"]}  ###')
-                            uplink = port['portId']
-                            # Check if LLDP information is available
-                            if 'lldp' in port and 'systemName' in port['lldp']:
-                                lldp_info = port['lldp']['systemName']
-                            else:
-                                lldp_info = 'lldp not enabled'
-                            # Get uplink port details for description
-                            uplink_info = dashboard.switch.getDeviceSwitchPort(
-                                serial, port['portId']
-                            )
-                            uplink_description = uplink_info['name']
-
-                    # Store relevant switch information
-                    self.switches.append({
-                        'name': device['name'],
-                        'model': device['model'],
-                        'serial': device['serial'],
-                        'mac': device['mac'],
-                        'status': device['status'],
-                        'lan ip': device['lanIp'],
-                        'ports up': f'{ports_connected}/{num_ports}',
-                        'uplink interface': f'port{uplink}',
-                        'uplink descp': uplink_description,
-                        'uplink lldp info': lldp_info
-                    })
+            # Check each device to identify switches
+            switch_devices = [d for d in self.org_devices if d['productType'] == 'switch']
+
+            fetch = partial(self._switch_info, dashboard)
+            if max_workers <= 1:
+                self.switches.extend(map(fetch, switch_devices))
+            else:
+                # map() keeps the organization's device order
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    self.switches.extend(executor.map(fetch, switch_devices))
 
         return self.switches
 
+    @staticmethod
+    def _switch_info(dashboard, device: dict) -> dict:
+        """
+        Build the information dictionary of one switch.
+
+        Args:
+            dashboard: Meraki DashboardAPI session
+            device: Device status entry of the switch
+
+        Returns:
+            dict: Switch information (ports up, uplink details, ...)
+        """
+        serial = device['serial']
+        # Request port status for this switch
+        port_status = dashboard.switch.getDeviceSwitchPortsStatuses(serial)
+        num_ports = len(port_status)  # Total number of ports
+        ports_connected = 0
+        uplink = None
+        uplink_description = None
+        lldp_info = None
+
+        for port in port_status:
+            # Check each port and count connected ones
+            if port['status'] == 'Connected':
+                ports_connected += 1
+            # Detect uplink port to get additional information
+            if port['isUplink'] == True:
+                print('###  UPLINK DETECTED  ###')
+                print(f'###  port{port["portId"]} for {device["name"]}  ###')
+                uplink = port['portId']
+                # Check if LLDP information is available
+                if 'lldp' in port and 'systemName' in port['lldp']:
+                    lldp_info = port['lldp']['systemName']
+                else:
+                    lldp_info = 'lldp not enabled'
+                # Get uplink port details for description
+                uplink_info = dashboard.switch.getDeviceSwitchPort(
+                    serial, port['portId']
+                )
+                uplink_description = uplink_info['name']
+
+        # Relevant switch information
+        return {
+            'name': device['name'],
+            'model': device['model'],
+            'serial': device['serial'],
+            'mac': device['mac'],
+            'status': device['status'],
+            'lan ip': device['lanIp'],
+            'ports up': f'{ports_connected}/{num_ports}',
+            'uplink interface': f'port{uplink}',
+            'uplink descp': uplink_description,
+            'uplink lldp info': lldp_info
+        }
+
 
 def get_switches(API_KEY: str, org_id: str) -> list:
     """
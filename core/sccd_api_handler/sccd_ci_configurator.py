@@ -4,12 +4,15 @@ SCCD_CI_Configurator class used to normalize data and interact with SCCD_CI in s
 """
 
 import re
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Iterable, List, Tuple
 from time import sleep
 from pprint import pprint
 
 from .sccd_ci_connector import SCCD_CI
 from .sccd_loc_connector import SCCD_LOC
+from .sccd_result import BulkResult
 
 class SCCD_CI_Configurator:
 
@@ -17,6 +20,9 @@ class SCCD_CI_Configurator:
     Class used to normalize data and interact with SCCD_CI
     """
 
+    # Failed CIDs listed in a BulkResult message (the full list is in details)
+    FAILED_CIDS_SHOWN = 20
+
     def __init__(self, user_sccd, pass_sccd):
         self.user_sccd = user_sccd
         self.pass_sccd = pass_sccd
@@ -392,15 +398,38 @@ class SCCD_CI_Configurator:
 
     #backoffice methods
 
-    def put_multiples_ci(self, cids:List[dict]):
-        for cid in cids:
-            self.sccd_ci.put_ci(cid.get("assetnum"),
-                                cid.get("location"),
-                                cid.get("classstructureid"),
-                                cid.get("pluspcustomer"),
-                                cid.get("ccipersongroup"))
+    def put_multiples_ci(self, cids: Iterable[dict], batch_size: int = 200) -> BulkResult:
+        """Create the configuration items listed in cids.
+        :param cids: Iterable (list or lazy iterator) of dictionaries with assetnum, location, classstructureid, pluspcustomer and ccipersongroup keys
+        :param batch_size: Number of CIs read from cids and sent per batch
+        :return: BulkResult with the list of failed CIDs in details
+        """
+        failed = []
+        cids = iter(cids)
+        # put_ci is one HTTP POST per CI, so each batch is sent concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            while batch := list(islice(cids, batch_size)):
+                futures = {
+                    executor.submit(self.sccd_ci.put_ci,
+                                    cid.get("assetnum"),
+                                    cid.get("location"),
+                                    cid.get("classstructureid"),
+                                    cid.get("pluspcustomer"),
+                                    cid.get("ccipersongroup")): cid.get("assetnum")
+                    for cid in batch
+                }
+                for future in as_completed(futures):
+                    if future.result() == "error":
+                        failed.append(futures[future])
+        if failed:
+            # The message ends up in a dialog: list only the first few CIDs there
+            print(f"CIs not created in SCCD: {', '.join(map(str, failed))}")
+            shown = ', '.join(map(str, failed[:self.FAILED_CIDS_SHOWN]))
+            more = "…" if len(failed) > self.FAILED_CIDS_SHOWN else ""
+            return BulkResult(False, f"{len(failed)} CIs could not be created: {shown}{more}",
+                              {"failed": failed})
         print("All CIs created/updated in SCCD")
-        return "success"
+        return BulkResult(True, "success, all CIs created/updated in SCCD")
     
 def test():
     sccd_ci_conf = SCCD_CI_Configurator("","")
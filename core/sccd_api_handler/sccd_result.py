@@ -0,0 +1,24 @@
+"""
+SCCD Bulk Result Module.
+
+This module provides the BulkResult dataclass returned by the SCCD connector
+methods that operate on many Configuration Items at once, so callers can
+branch on a single boolean instead of inspecting dicts or strings.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BulkResult:
+    """
+    Outcome of a bulk SCCD operation.
+
+    Attributes:
+        ok (bool): True if the whole operation succeeded
+        message (str): Human readable summary of the outcome
+        details (dict | None): Optional extra information (e.g. failed items)
+    """
+    ok: bool
+    message: str
+    details: dict | None = None
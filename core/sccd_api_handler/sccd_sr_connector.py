@@ -5,6 +5,8 @@
 import requests
 from pprint import pprint
 
+from .sccd_result import BulkResult
+
 
 class SCCD_SR:
  
@@ -46,7 +48,7 @@ class SCCD_SR:
         except Exception as e:
             return {"error": str(e)}
         
-    def add_cis_to_sr(self, sr, cids: list[dict]):
+    def add_cis_to_sr(self, sr, cids: list[dict]) -> BulkResult:
         #Add CIs to Service Request
         try:
             href_post = self.get_sr_href(sr)
@@ -57,14 +59,15 @@ class SCCD_SR:
             post_response = self.session.post(href_post, json=jedi, headers=self.myheaders, auth=(self.user_sccd, self.pass_sccd))
             if post_response.status_code in [200, 201]:
                 print(f"success, {len(cids)} CIs added to {sr}")
-                return {"success":f"CIs added to Service Request: {sr}"}
+                return BulkResult(True, f"CIs added to Service Request: {sr}")
             else:
                 print(f"error: Failed to add CIs to Service Request: {sr}")
-                return {f"error: Failed to add CIs to Service Request: {sr}, error code: {str(post_response.status_code)}"}
+                return BulkResult(False, f"Failed to add CIs to Service Request: {sr}, error code: {post_response.status_code}",
+                                  {"status_code": post_response.status_code})
 
         except Exception as e:
             print(e)
-            return f"error: {e}"
+            return BulkResult(False, f"error: {e}")
         
 if __name__ == "__main__":
     sccd_sr = SCCD_SR("", "")
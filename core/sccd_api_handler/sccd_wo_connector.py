@@ -12,14 +12,19 @@ Provides functionality to:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from requests.exceptions import Timeout, RequestException
 from pprint import pprint
 from bs4 import BeautifulSoup
+import copy
 import html
 import re
+import time
 from datetime import datetime
 
+from .sccd_result import BulkResult
+
 
 class SCCD_WO:
     """
@@ -34,9 +39,15 @@ class SCCD_WO:
         pass_sccd (str): SCCD login password
         url_sccd (str): Base URL for SCCD API
         validate_credentials (Response): Initial credential validation response
-        session (requests.Session): HTTP session for API requests
+        session (requests.Session): Keep-alive HTTP session shared by all API requests
     """
 
+    # Keep-alive connections kept per host: the manager's single executor
+    # worker plus one for calls made on the GUI thread (e.g. the login check)
+    POOL_SIZE = 2
+    # Seconds a fetched work order list is reused by get_work_orders
+    WO_CACHE_TTL = 10
+
     def __init__(self, owner: str, user_sccd: str, pass_sccd: str):
         """
         Initialize the SCCD client and validate credentials.
@@ -50,11 +61,16 @@ class SCCD_WO:
         self.user_sccd = user_sccd
         self.pass_sccd = pass_sccd
         self.url_sccd = 'https://servicedesk.cwc.com/maximo/'
+
+        # Reuse TLS connections across calls (only one SCCD host is used)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_SIZE, pool_block=False)
+        self.session.mount('https://', adapter)
+
         # Validate credentials on initialization
         self.auth = HTTPBasicAuth(self.user_sccd, self.pass_sccd)
-        self.validate_credentials = requests.get(self.url_sccd, auth=self.auth, timeout=10)
+        self.validate_credentials = self.session.get(self.url_sccd, auth=self.auth, timeout=10)
 
-        self.session = requests.Session()
         self.myheaders = {
             'x-method-override': 'PATCH',
             'patchtype': 'MERGE',
@@ -62,13 +78,26 @@ class SCCD_WO:
             'properties': '*'
         }
 
+        # Short-lived cache for get_work_orders
+        self._wo_cache = None
+        self._wo_cache_ts = 0.0
+
+    def invalidate_wo_cache(self) -> None:
+        """Drop the cached work order list so the next fetch hits the server."""
+        self._wo_cache = None
+        self._wo_cache_ts = 0.0
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
 
     def get_work_orders(self) -> list | dict:
         """
         Retrieve all work orders assigned to the owner.
 
         Fetches work orders with status WORKPENDING, INPRG, or QUEUED
-        that are not tasks (istask=false).
+        that are not tasks (istask=false). A successful result is cached for
+        WO_CACHE_TTL seconds; each call returns its own copy of the list.
 
         Returns:
             list: List of normalized work order dictionaries, with the following keys:
@@ -87,12 +116,17 @@ class SCCD_WO:
             f'{self.url_sccd}oslc/os/sidwo?lean=1&oslc.pageSize=60&oslc.select=*'
             f'&oslc.where=owner="{self.owner}"and status IN ["WORKPENDING","INPRG","QUEUED"]and istask=false'
         )
+        cache = self._wo_cache
+        if cache is not None and time.monotonic() - self._wo_cache_ts < self.WO_CACHE_TTL:
+            return copy.deepcopy(cache)
         try:
             response = self.session.get(url_lref_allwo, auth=(self.user_sccd, self.pass_sccd))
             if response.status_code == 200:
                 wos_data_dic = response.json()
                 wos_data_normalized = SCCD_WO.normalize_work_order_data(wos_data_dic)
                 print(f"{len(wos_data_normalized)} workorders are assigned to {self.owner}")
+                self._wo_cache = copy.deepcopy(wos_data_normalized)
+                self._wo_cache_ts = time.monotonic()
                 return wos_data_normalized
             else:
                 return {"error": "Failed to retrieve work orders"}
@@ -250,6 +284,7 @@ class SCCD_WO:
                 auth=(self.user_sccd, self.pass_sccd)
             )
             if post_response.status_code in [200, 201]:
+                self.invalidate_wo_cache()
                 print(f"success, Work order {wo_id} status changed to {new_state}")
                 return {"success": f"Work order {wo_id} status changed to {new_state}"}
             else:
@@ -287,6 +322,7 @@ class SCCD_WO:
                 auth=(self.user_sccd, self.pass_sccd)
             )
             if post_response.status_code in [200, 201]:
+                self.invalidate_wo_cache()
                 print(f"success, log added to work order {wo_id}")
                 return {"success": f"Log added to work order {wo_id}"}
             else:
@@ -294,7 +330,7 @@ class SCCD_WO:
         except Exception as e:
             return {"error": str(e)}
 
-    def add_cis_to_work_order(self, wo_id: str, cids: list[dict]) -> dict:
+    def add_cis_to_work_order(self, wo_id: str, cids: list[dict]) -> BulkResult:
         """
         Add Configuration Items (CIs) to a work order or task.
 
@@ -303,7 +339,7 @@ class SCCD_WO:
             cids: List of CI dictionaries with 'cid' and 'description' keys
 
         Returns:
-            dict: Success or error message
+            BulkResult: Outcome of the operation
         """
         try:
             href_post = self.get_post_url(wo_id)
@@ -318,12 +354,14 @@ class SCCD_WO:
                 auth=(self.user_sccd, self.pass_sccd)
             )
             if post_response.status_code in [200, 201]:
+                self.invalidate_wo_cache()
                 print(f"success, {len(cids)} CIs added to {wo_id}")
-                return {"success": f"CIs added to work order/task {wo_id}"}
+                return BulkResult(True, f"CIs added to work order/task {wo_id}")
             else:
-                return {"error": f"Failed to add CIs to work order/task {wo_id}"}
+                return BulkResult(False, f"Failed to add CIs to work order/task {wo_id}",
+                                  {"status_code": post_response.status_code})
         except Exception as e:
-            return {"error": str(e)}
+            return BulkResult(False, str(e))
 
 
 def main():
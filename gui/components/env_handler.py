@@ -10,12 +10,13 @@ import os
 import sys
 import dotenv
 from pathlib import Path
-from passlib.context import CryptContext
 
 import tkinter
 from tkinter import ttk
 import keyring
 
+from .password_hashing import HASH_CONTEXT
+
 
 class EnvHandler:
     """
@@ -41,12 +42,8 @@ class EnvHandler:
             master: Optional Tkinter master widget
         """
         self.master = master
-        # Hash context for password hashing using PBKDF2-SHA256
-        self.__hash_context = CryptContext(
-            schemes=["pbkdf2_sha256"],
-            default="pbkdf2_sha256",
-            pbkdf2_sha256__default_rounds=5000
-        )
+        # Hash context for password hashing (shared with the login check)
+        self.__hash_context = HASH_CONTEXT
 
         # Absolute path to icon.ico file
         self.icon_path = Path(__file__).resolve().parent.parent.parent / 'resources' / 'icon.ico'
@@ -90,7 +87,7 @@ class EnvHandler:
         Open a dialog to change the application access password.
 
         Creates a Toplevel window prompting for new password with confirmation.
-        The password is hashed using PBKDF2-SHA256 and stored in .env file.
+        The password is hashed using argon2id and stored in .env file.
         """
         print("Change password")
 
@@ -0,0 +1,21 @@
+"""
+Password Hashing Module.
+
+Shared passlib context for the application access password, used both to
+verify it at login (initialize.py) and to hash a new one (EnvHandler).
+"""
+
+from passlib.context import CryptContext
+
+# New hashes use argon2id; pbkdf2_sha256 hashes created before still verify
+# and are flagged for rehashing (the scheme is read from the stored hash)
+HASH_CONTEXT = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"],
+    default="argon2",
+    deprecated=["pbkdf2_sha256"],
+    argon2__type="ID",
+    argon2__time_cost=3,
+    argon2__memory_cost=64 * 1024,
+    argon2__parallelism=1,
+    pbkdf2_sha256__default_rounds=600000
+)
@@ -3,16 +3,19 @@ GUI Utility Functions Module.
 
 This module provides utility functions for the GUI including:
 - Error dialog display
-- Excel file save/load operations using pandas
+- Excel file save/load operations: .xlsx rows can be streamed through
+  openpyxl in read-only mode; pandas (imported lazily) is only used for
+  saving and for the cached whole-file read
 """
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
+import os
 import tkinter
 from tkinter.filedialog import asksaveasfilename, askopenfilename
 from tkinter.messagebox import showwarning
 
-import pandas as pd
-
 # Absolute path to azure.tcl theme file
 theme_path = Path(__file__).resolve().parent.parent.parent / 'resources' / 'azure.tcl'
 
@@ -53,6 +56,8 @@ def save_excel(data: list) -> None:
     Args:
         data: Array of dictionaries [{}, {}, {}...] to save as Excel
     """
+    import pandas as pd  # lazy: pandas is slow to import and only needed here
+
     # Create DataFrame
     df = pd.DataFrame(data)
 
@@ -71,31 +76,122 @@ def save_excel(data: list) -> None:
         print("Save cancelled.")
 
 
-def load_excel() -> list:
+@lru_cache(maxsize=4)
+def _read_excel_cached(file_path: str, mtime_ns: int, size: int) -> tuple:
     """
-    Load data from an Excel file.
+    Parse an Excel file into an immutable tuple of row dictionaries.
 
-    Opens a file dialog to select an Excel file and returns its contents
-    as a list of dictionaries.
+    The modification time and size are part of the cache key only, so an
+    edited file is re-parsed while repeated loads of the same file are free.
 
-    The first row is interpreted as headers (keys).
-    Keys are normalized to lowercase.
+    Args:
+        file_path: Path to the Excel file
+        mtime_ns: File modification time in nanoseconds (cache key)
+        size: File size in bytes (cache key)
 
     Returns:
-        list: List of dictionaries with data from the Excel file,
-              or empty list if cancelled
+        tuple: Tuple of dictionaries with normalized lowercase keys
     """
-    file_path = askopenfilename(
+    import pandas as pd  # lazy: pandas is slow to import and only needed here
+
+    df = pd.read_excel(file_path)
+    # Normalize headers: convert to string, strip whitespace, lowercase
+    df.columns = [str(c).strip().lower() for c in df.columns]
+
+    return tuple(df.to_dict(orient="records"))
+
+
+def _iter_excel_rows(file_path: str) -> Iterator[dict]:
+    """
+    Lazily yield the rows of an .xlsx file as dictionaries.
+
+    The workbook is opened in read-only mode so only the current row is
+    kept in memory. Empty cells are returned as None.
+
+    Args:
+        file_path: Path to the .xlsx file
+
+    Yields:
+        dict: Row data with normalized lowercase keys
+    """
+    import openpyxl  # lazy: only needed when streaming a workbook
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        keys = [str(c).strip().lower() for c in header]
+        for values in rows:
+            if all(v is None for v in values):
+                continue  # Skip blank rows, as pandas does
+            yield dict(zip(keys, values))
+    finally:
+        wb.close()
+
+
+def ask_excel_path() -> str:
+    """
+    Open a file dialog to select an Excel file.
+
+    Must be called from the Tk main thread.
+
+    Returns:
+        str: Selected file path, or empty string if cancelled
+    """
+    return askopenfilename(
         filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")],
         title="Open file"
     )
 
+
+def read_excel(file_path: str, stream: bool = False) -> list | Iterator[dict]:
+    """
+    Read the contents of an Excel file without any dialog.
+
+    The first row is interpreted as headers (keys).
+    Keys are normalized to lowercase. Parsed content is cached by file
+    path, modification time and size. Safe to call from worker threads.
+
+    Args:
+        file_path: Path to the Excel file
+        stream: If True, return an iterator that parses .xlsx rows on demand
+                instead of a cached list
+
+    Returns:
+        list: List of dictionaries with data from the Excel file
+              (an iterator when stream is True)
+    """
+    if stream and file_path.lower().endswith(".xlsx"):
+        return _iter_excel_rows(file_path)
+
+    stat = os.stat(file_path)
+    records = _read_excel_cached(file_path, stat.st_mtime_ns, stat.st_size)
+
+    # Return copies so callers cannot alter the cached rows
+    return [dict(row) for row in records]
+
+
+def load_excel(stream: bool = False) -> list | Iterator[dict]:
+    """
+    Load data from an Excel file.
+
+    Opens a file dialog to select an Excel file and returns its contents
+    as a list of dictionaries (see read_excel).
+
+    Args:
+        stream: If True, return an iterator that parses .xlsx rows on demand
+                instead of a cached list
+
+    Returns:
+        list: List of dictionaries with data from the Excel file,
+              or empty list if cancelled (an iterator when stream is True)
+    """
+    file_path = ask_excel_path()
+
     if not file_path:
         print("Load cancelled.")
         return []
 
-    df = pd.read_excel(file_path)
-    # Normalize headers: convert to string, strip whitespace, lowercase
-    df.columns = [str(c).strip().lower() for c in df.columns]
-
-    return df.to_dict(orient="records")
+    return read_excel(file_path, stream)
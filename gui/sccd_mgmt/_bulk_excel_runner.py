@@ -0,0 +1,111 @@
+"""
+Bulk Excel Runner Module.
+
+This module provides run_bulk, the shared Excel -> validate -> SCCD workflow
+used by the back office and multi-asset assignment modules. The file dialog
+runs in the Tk main thread, while parsing the file and calling SCCD run in a
+background thread whose result is polled with after().
+"""
+
+import logging
+import queue
+import threading
+from itertools import chain
+from tkinter import ttk
+from typing import Callable, Optional
+
+from ..components.utils import ask_excel_path, read_excel, error_window, infoW
+
+logger = logging.getLogger(__name__)
+
+# Interval (ms) used to poll the worker thread result
+POLL_MS = 100
+
+# ttk style shared by the bulk action buttons
+BULK_BUTTON_STYLE = "Bulk.TButton"
+
+
+def bulk_button_style(widget) -> str:
+    """
+    Return the bulk button style name, configuring it on first use.
+
+    The style is checked in the widget's own Tcl interpreter, so it is
+    configured once per interpreter however many forms use it.
+
+    Args:
+        widget: Any Tkinter widget of the window that shows the buttons
+    """
+    style = ttk.Style(widget)
+    if not style.lookup(BULK_BUTTON_STYLE, "padding"):
+        style.configure(BULK_BUTTON_STYLE, padding=6)
+    return BULK_BUTTON_STYLE
+
+
+def run_bulk(parent, action_label: str, connector_factory: Callable, bulk_method_name: str,
+             require_id: Optional[Callable[[], str]] = None, id_name: str = "ID",
+             stream: bool = False) -> None:
+    """
+    Load an Excel file and send its rows to a bulk SCCD connector method.
+
+    Args:
+        parent: Tkinter widget used to schedule the result polling
+        action_label: Text shown in console messages and dialogs
+        connector_factory: Callable returning the SCCD connector instance
+        bulk_method_name: Connector method to call; it receives (id, data)
+                          when require_id is given, (data) otherwise, and
+                          returns a BulkResult
+        require_id: Optional callable returning the target ID (e.g. SR/WO)
+        id_name: Name of the ID shown in the validation error
+        stream: If True, rows are parsed lazily while being uploaded
+    """
+    args = ()
+    if require_id is not None:
+        id_value = require_id().strip()
+        if not id_value:
+            error_window(f"Please, enter a valid {id_name}.")
+            return
+        args = (id_value,)
+
+    print(f"Please, select an Excel file (.xlsx) for {action_label}.")
+    file_path = ask_excel_path()
+    if not file_path:
+        print("Load cancelled.")
+        return
+
+    results = queue.Queue()
+
+    def worker():
+        try:
+            data = read_excel(file_path, stream)
+            if stream:
+                # Peek the first row so an empty file is rejected before connecting
+                rows = iter(data)
+                first = next(rows, None)
+                data = None if first is None else chain((first,), rows)
+            if not data:
+                results.put(("error", "The selected file has no data."))
+                return
+            connector = connector_factory()
+            result = getattr(connector, bulk_method_name)(*args, data)
+            logger.debug("%s result=%r", bulk_method_name, result)
+            results.put(("done", result))
+        except Exception as e:
+            results.put(("error", f"Error: {e}"))
+
+    def poll():
+        try:
+            kind, payload = results.get_nowait()
+        except queue.Empty:
+            parent.after(POLL_MS, poll)
+            return
+        if kind == "error":
+            error_window(payload)
+        elif payload.ok:
+            print(payload.message)
+            infoW(action_label, payload.message)
+        else:
+            error_window(payload.message)
+
+    print(f"{action_label} in progress...")
+    threading.Thread(target=worker, daemon=True).start()
+    parent.after(POLL_MS, poll)
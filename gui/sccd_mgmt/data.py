@@ -6,6 +6,12 @@ used in the SCCD Work Order Manager interface for standardized logging
 and maintenance window documentation.
 """
 
+
+def log_code(title: str) -> str:
+    """Return the code prefix of a log title (e.g. 'N20' for 'N20. MAINTENANCE WINDOW STARTED')."""
+    return title.split(".", 1)[0].strip()
+
+
 log_options = ('---',
     'P00. PROJECT INITIAL REVIEW',
     'P01. INTERNAL KICK OFF',
@@ -101,4 +107,15 @@ status: COMPLETED
 start_date: yyyy-mm-dd hh:mm
 end_date: yyyy-mm-dd hh:mm
 details: <MW INFO>
-"""
\ No newline at end of file
+"""
+
+# Behaviour of each log code, built once from the predefined options:
+#   column       -> table column that also takes the note ('project_info'/'pm'), or None
+#   mw_email     -> whether applying the log generates the MW email
+#   default_note -> note text pre-filled when the option is selected
+DEFAULT_LOG_ACTION = {"column": None, "mw_email": False, "default_note": "Please add additional details here..."}
+LOG_ACTIONS = {log_code(opt): dict(DEFAULT_LOG_ACTION) for opt in log_options + log_options_spanish if "." in opt}
+LOG_ACTIONS["P00"]["column"] = "project_info"
+LOG_ACTIONS["N27"]["column"] = "pm"
+LOG_ACTIONS["N20"].update(mw_email=True, default_note=default_mw_text_1)
+LOG_ACTIONS["N21"].update(mw_email=True, default_note=default_mw_text_2)
@@ -8,7 +8,7 @@ Items (CIs/assets) from an Excel file to a Work Order or Task in SCCD.
 from tkinter import ttk
 import tkinter as tk
 
-from ..components.utils import load_excel, error_window, infoW
+from ._bulk_excel_runner import run_bulk, bulk_button_style
 from core import SCCD_WO as SCCD
 
 
@@ -28,32 +28,20 @@ def main_function(root_win, sccd_owner: str, sccd_user: str, sccd_pass: str) ->
     """
     wo_tk = tk.StringVar()
 
-    def assign_assets_button_function(wo_id: str = None) -> None:
-        """
-        Load assets from Excel and assign them to the specified work order.
-
-        Args:
-            wo_id: Work Order or Task ID to assign assets to
-        """
-        try:
-            data = load_excel()
-            if not data:
-                return  # Exit if no file was loaded
-            sccd_connector = SCCD(sccd_owner, sccd_user, sccd_pass)
-            result = sccd_connector.add_cis_to_work_order(wo_id, data)
-            if "success" in result:
-                print(result["success"])
-                infoW("Success", f"Assets successfully assigned to {wo_id}.")
-            else:
-                error_window(result.get("error", "Unknown error occurred"))
-        except Exception as e:
-            error_window(f"Error: {e}")
+    def assign_assets_button_function() -> None:
+        """Load assets from Excel and assign them to the work order in the entry."""
+        run_bulk(root_win, "Multi-Asset Assignment",
+                 lambda: SCCD(sccd_owner, sccd_user, sccd_pass), "add_cis_to_work_order",
+                 require_id=wo_tk.get, id_name="Work Order/Task ID")
 
     # Multi-asset assignment button and input field
-    ttk.Label(root_win, text="Work Order/Task ID:").pack(padx=15, pady=15)
-    ttk.Entry(root_win, textvariable=wo_tk).pack(padx=15, pady=15)
+    form = ttk.Frame(root_win)
+    form.pack()
+    ttk.Label(form, text="Work Order/Task ID:").grid(row=0, column=0, padx=15, pady=15)
+    ttk.Entry(form, textvariable=wo_tk).grid(row=1, column=0, padx=15, pady=15)
     ttk.Button(
-        root_win,
+        form,
         text='Multi-Asset Assignment',
-        command=lambda: assign_assets_button_function(wo_tk.get())
-    ).pack(padx=15, pady=15)
+        style=bulk_button_style(root_win),
+        command=assign_assets_button_function
+    ).grid(row=2, column=0, padx=15, pady=15)
@@ -6,9 +6,13 @@ maintenance window notifications from structured text input using
 Jinja2 templates.
 """
 
+import os
 import re
 from jinja2 import Template
 
+# Output folder for generated MW emails, created once on import
+os.makedirs('outputs', exist_ok=True)
+
 
 def parse_text_to_dict(text: str) -> dict:
     """
@@ -79,12 +83,10 @@ def generate_MW_email(text: str) -> None:
     """
     mw_dic = parse_text_to_dict(text)
     print(mw_dic)
-    print('outputs/MW_' + mw_dic['rfc'] + '.html')
-    generate_html_from_template(
-        'resources/states/email.html',
-        'outputs/MW_' + mw_dic['rfc'] + '_' + mw_dic['status'] + '.html',
-        mw_dic
-    )
+    rfc, status = mw_dic['rfc'], mw_dic['status']
+    output_file = f'outputs/MW_{rfc}_{status}.html'
+    print(output_file)
+    generate_html_from_template('resources/states/email.html', output_file, mw_dic)
 
 
 # Sample text for testing
@@ -7,21 +7,23 @@ functionality for updating states, adding logs, and exporting data.
 """
 
 from pathlib import Path
+import logging
+import threading
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
-from pprint import pprint
 
 from .sccd_table import Table
 from .wo_timers import WorkOrderTimers
 from core import SCCD_WO
 
-from .utils import export_treeview_to_excel, parse_minutes
-from .mw_email_gen import generate_MW_email
+from .utils import parse_minutes, export_treeview_to_excel
 
-from .data import log_options, log_options_spanish, default_mw_text_1, default_mw_text_2
+from .data import log_options, log_options_spanish, log_code, LOG_ACTIONS, DEFAULT_LOG_ACTION
 
+logger = logging.getLogger(__name__)
 
 # ------------------- App wiring -------------------
 
@@ -31,12 +33,12 @@ class AppStates(tk.Toplevel):
 
     Integrates the work order Table view with WorkOrderTimers controller
     for countdown functionality. Provides popups for updating work order
-    states and adding logs. Uses ThreadPoolExecutor for non-blocking
-    server updates.
+    states and adding logs. Uses a single-worker ThreadPoolExecutor for
+    non-blocking, ordered server updates.
 
     Attributes:
         table (Table): Work order data table widget
-        executor (ThreadPoolExecutor): Thread pool for async server calls
+        executor (ThreadPoolExecutor): Single-worker pool for async server calls
         timers (WorkOrderTimers): Timer controller for countdown management
         sccd (SCCD_WO): SCCD API client for server operations
         on_close: Callback function invoked when window closes
@@ -57,7 +59,9 @@ class AppStates(tk.Toplevel):
 
         # Absolute path to icon.ico file
         self.icon_path = Path(__file__).resolve().parent.parent.parent / 'resources' / 'icon.ico'
-        self.iconbitmap(self.icon_path)
+        # .ico can only be applied through iconbitmap; convert the path once for all popups
+        self._icon_path_str = str(self.icon_path)
+        self.iconbitmap(self._icon_path_str)
 
         # Table setup, columns and headings
         # Columns values correspond to SCCD get_work_orders dict keys
@@ -67,8 +71,17 @@ class AppStates(tk.Toplevel):
         self.table = Table(self, columns=self.columns, headings=self.headings, height=14, user_sccd=user_sccd, pass_sccd=pass_sccd)
         self.table.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Executor for async DB updates (server calls)
-        self.executor = ThreadPoolExecutor(max_workers=6)
+        # Timer expirations waiting to be sent to the server as one batch
+        self._pending_expiries: list[str] = []
+        self._expiry_after_id = None
+
+        # Single worker for async DB updates (server calls): writes run in
+        # submission order over the same warm keep-alive connection
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        # Caps queued + running tasks; beyond it tasks wait in _overflow
+        self._task_slots = threading.BoundedSemaphore(self.MAX_PENDING_TASKS)
+        self._overflow: deque = deque()
+        self._overflow_after_id = None
 
         # Timers controller (GUI-safe)
         self.timers = WorkOrderTimers(
@@ -79,23 +92,34 @@ class AppStates(tk.Toplevel):
         # Initialize SCCD connector
         self.sccd = SCCD_WO(owner, user_sccd, pass_sccd)
 
-        # Load initial data
-        self.reload_from_db()
-
         # Toolbar
         toolbar = ttk.Frame(self)
         toolbar.pack(fill="x", padx=10, pady=(0, 10))
-        ttk.Button(toolbar, text="Update State", command=self.open_update_state_popup).pack(side="left", padx=6)
-        ttk.Button(toolbar, text="Add log", command=self.open_add_log_popup).pack(side="left", padx=6)
-        ttk.Button(toolbar, text="Export to Excel", command=self.export_to_excel).pack(side="left", padx=6)
-        ttk.Button(toolbar, text="Clear", command=self.handle_clear).pack(side="left", padx=6)
-        ttk.Button(toolbar, text="Refresh", command=self.handle_soft_clear).pack(side="left", padx=6)
-        # Search functionality
+        self._toolbar_buttons = [
+            ttk.Button(toolbar, text="Update State", command=self.open_update_state_popup),
+            ttk.Button(toolbar, text="Add log", command=self.open_add_log_popup),
+            ttk.Button(toolbar, text="Export to Excel", command=self.export_to_excel),
+            ttk.Button(toolbar, text="Clear", command=self.handle_clear),
+            ttk.Button(toolbar, text="Refresh", command=self.handle_soft_clear),
+        ]
+        for button in self._toolbar_buttons:
+            button.pack(side="left", padx=6)
+        # Shown only while work orders are being fetched
+        self._progress = ttk.Progressbar(toolbar, mode="indeterminate", length=100)
+        self._reload_after_id = None
+        # Search functionality (live search is debounced; Return fires immediately)
         self.search_var = tk.StringVar()
+        self._search_after = None
+        # Last search (query, table revision) and its matches, to skip repeats
+        self._last_query = None
+        self._last_matches = []
+        self._match_pos = 0
         search_entry = ttk.Entry(toolbar, textvariable=self.search_var)
-        search_entry.bind("<Return>", lambda event: self.search_and_highlight())
+        search_entry.bind("<Return>", lambda event: self._search_now())
+        # Live search runs on text changes only (not on arrows, Shift, Tab, ...)
+        self.search_var.trace_add("write", self._schedule_search)
         search_entry.pack(side="right", padx=6)
-        ttk.Button(toolbar, text="Search", command=self.search_and_highlight).pack(side="right", padx=6)
+        ttk.Button(toolbar, text="Search", command=self._search_now).pack(side="right", padx=6)
 
         # on_close callback
         self.on_close = on_close
@@ -103,29 +127,163 @@ class AppStates(tk.Toplevel):
         # Make sure window closes cleanly
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
+        # Load initial data (in background; the window stays responsive)
+        self.reload_from_db()
+
 
 
 
 
     # ---------- Data & server ops ----------
 
+    MAX_PENDING_TASKS = 128
+    # Retry interval (ms) for tasks deferred while the executor queue is full
+    OVERFLOW_RETRY_MS = 200
+
+    RELOAD_POLL_MS = 100
+
     def reload_from_db(self):
         """Reload work orders from the SCCD server into the table."""
-        rows = self.sccd.get_work_orders()
-        self.table.load(rows)
+        self._reload_async()
+
+    def _reload_async(self, prepare=None):
+        """
+        Fetch work orders on the executor and load them when ready.
+
+        The toolbar is disabled and a progress bar is shown during the
+        fetch. The result is picked up by polling with after(), so Tk is
+        only touched from the GUI thread.
+
+        Args:
+            prepare: Optional callable run on the GUI thread with the
+                     fetched rows before they are loaded into the table
+        """
+        if self._reload_after_id is not None:
+            return  # a fetch is already in progress
+        future = self._submit(self.sccd.get_work_orders, defer=False)
+        if future is None:
+            messagebox.showwarning(
+                "SCCD", "Server updates are still being sent. Please refresh again shortly.",
+                parent=self)
+            return
+        for button in self._toolbar_buttons:
+            button.state(["disabled"])
+        self._progress.pack(side="left", padx=6)
+        self._progress.start()
+
+        def poll():
+            if not future.done():
+                self._reload_after_id = self.after(self.RELOAD_POLL_MS, poll)
+                return
+            self._reload_after_id = None
+            self._progress.stop()
+            self._progress.pack_forget()
+            for button in self._toolbar_buttons:
+                button.state(["!disabled"])
+            try:
+                rows = future.result()
+            except Exception as e:
+                messagebox.showerror("SCCD", f"Could not load work orders: {e}", parent=self)
+                return
+            if prepare is not None:
+                prepare(rows)
+            # rows are a fresh copy from the connector, used only here
+            self.table.load(rows, take_ownership=True)
+
+        self._reload_after_id = self.after(self.RELOAD_POLL_MS, poll)
 
     def async_update_state_in_server(self, wo_id: str, new_state: str):
         """Dispatch a server update to a background thread (non-blocking)."""
-        self.executor.submit(self.sccd.update_work_order_state, wo_id, new_state)
+        self.async_update_states_batch([(wo_id, new_state)])
 
     def async_update_log_in_server(self, wo_id: str, title: str, note: str):
         """Dispatch a log update to a background thread (non-blocking)."""
-        self.executor.submit(self.sccd.update_work_order_log, wo_id, title, note)
+        self.async_update_logs_batch([(wo_id, title, note)])
+
+    def async_update_states_batch(self, batch: list[tuple[str, str]]):
+        """Dispatch many (wo_id, new_state) updates as a single background task."""
+        if batch:
+            self._submit(self._run_state_batch, batch)
+
+    def async_update_logs_batch(self, batch: list[tuple[str, str, str]]):
+        """Dispatch many (wo_id, title, note) log updates as a single background task."""
+        if batch:
+            self._submit(self._run_log_batch, batch)
+
+    def _submit(self, fn, *args, defer: bool = True):
+        """
+        Queue fn(*args) on the executor, bounded to MAX_PENDING_TASKS.
+
+        Never blocks the Tk thread. When the queue is full the task is
+        deferred to _overflow, which is retried with after(); later tasks
+        queue behind it, so server calls still run in submission order (a
+        state change never overtakes an earlier one). The user is told once
+        per backlog. With defer=False a full queue refuses the task instead.
+
+        Returns:
+            Future | None: The queued task, or None if it was deferred,
+            refused, or the executor is shut down
+        """
+        if self._overflow or not self._task_slots.acquire(blocking=False):
+            if not defer:
+                return None
+            if not self._overflow:
+                logger.warning("Executor queue full; deferring %s", fn.__name__)
+                self.after_idle(
+                    messagebox.showwarning, "SCCD",
+                    "The SCCD server is responding slowly. Pending updates will be "
+                    "sent in order as it catches up.", parent=self)
+            self._overflow.append((fn, args))
+            if self._overflow_after_id is None:
+                self._overflow_after_id = self.after(self.OVERFLOW_RETRY_MS, self._drain_overflow)
+            return None
+        return self._submit_acquired(fn, args)
+
+    def _drain_overflow(self):
+        """Queue deferred tasks, oldest first, as executor slots free up."""
+        self._overflow_after_id = None
+        while self._overflow and self._task_slots.acquire(blocking=False):
+            fn, args = self._overflow.popleft()
+            self._submit_acquired(fn, args)
+        if self._overflow:
+            self._overflow_after_id = self.after(self.OVERFLOW_RETRY_MS, self._drain_overflow)
+
+    def _submit_acquired(self, fn, args):
+        """Submit fn(*args) holding a task slot; the slot is freed when it finishes."""
+        try:
+            future = self.executor.submit(fn, *args)
+        except RuntimeError:
+            # Executor already shut down (window closing)
+            self._task_slots.release()
+            return None
+        future.add_done_callback(lambda _f: self._task_slots.release())
+        return future
+
+    def _run_state_batch(self, batch: list[tuple[str, str]]):
+        """Worker: apply state updates back-to-back on one thread."""
+        for wo_id, new_state in batch:
+            self.sccd.update_work_order_state(wo_id, new_state)
+
+    def _run_log_batch(self, batch: list[tuple[str, str, str]]):
+        """Worker: add log entries back-to-back on one thread."""
+        for wo_id, title, note in batch:
+            self.sccd.update_work_order_log(wo_id, title, note)
+
+    EXPIRY_FLUSH_MS = 250
 
     def _on_timer_expired(self, wo_id: str):
         """Called when a timer reaches 0 (in GUI thread via timers)."""
-        # Visually already set to WORKPENDING by timers; just notify server async
-        self.async_update_state_in_server(wo_id, "WORKPENDING")
+        # Visually already set to WORKPENDING by timers; notify server async,
+        # coalescing expirations that happen close together into one batch
+        self._pending_expiries.append(wo_id)
+        if not self._expiry_after_id:
+            self._expiry_after_id = self.after(self.EXPIRY_FLUSH_MS, self._flush_expiries)
+
+    def _flush_expiries(self):
+        """Send all pending timer expirations as a single WORKPENDING batch."""
+        pending, self._pending_expiries = self._pending_expiries, []
+        self._expiry_after_id = None
+        self.async_update_states_batch([(wo_id, "WORKPENDING") for wo_id in pending])
 
     # ---------- Clear behavior ----------
 
@@ -137,13 +295,16 @@ class AppStates(tk.Toplevel):
         """
         self.timers.cancel_all()
 
-        rows = self.sccd.get_work_orders()
-        for row in rows:
-            row["time_min"] = 0
-            if row.get("state") == "INPRG":
-                row["state"] = "WORKPENDING"
-                self.async_update_state_in_server(row.get("wo_id", ""), "WORKPENDING")
-        self.table.load(rows)
+        def reset_rows(rows):
+            batch = []
+            for row in rows:
+                row["time_min"] = 0
+                if row.get("state") == "INPRG":
+                    row["state"] = "WORKPENDING"
+                    batch.append((row.get("wo_id", ""), "WORKPENDING"))
+            self.async_update_states_batch(batch)
+
+        self._reload_async(reset_rows)
     
     def handle_soft_clear(self):
         """Reset the view based on DB and stop all timers.
@@ -152,40 +313,96 @@ class AppStates(tk.Toplevel):
         """
         self.timers.cancel_all()
 
-        rows = self.sccd.get_work_orders()
-        for row in rows:
-            row["time_min"] = 0
-        self.table.load(rows)
+        def reset_timers(rows):
+            for row in rows:
+                row["time_min"] = 0
+
+        self._reload_async(reset_timers)
 
     # ---------- Search behavior ----------
-    def search_and_highlight(self):
-        """Search the table for the query and highlight matching rows."""
+    SEARCH_DEBOUNCE_MS = 150
+
+    def _schedule_search(self, *_trace_args):
+        """Debounce typing: only the last change in a burst triggers a search."""
+        if self._search_after:
+            self.after_cancel(self._search_after)
+        self._search_after = self.after(self.SEARCH_DEBOUNCE_MS, self._debounced_search)
+
+    def _debounced_search(self):
+        """Run the search scheduled by _schedule_search."""
+        self._search_after = None
+        self.search_and_highlight(cycle=False)
+
+    def _search_now(self):
+        """Cancel any pending debounced search and search immediately."""
+        if self._search_after:
+            self.after_cancel(self._search_after)
+            self._search_after = None
+        self.search_and_highlight()
+
+    def search_and_highlight(self, cycle: bool = True):
+        """Search the table for the query and highlight matching rows.
+        Repeating the last search on an unchanged table scrolls to the next
+        match when cycle is True and does nothing otherwise.
+        """
         query = self.search_var.get().strip().lower()
         if not query:
-            self.reset_highlights()
+            if cycle:
+                self.reset_highlights()
+            else:
+                # Live path: drop the highlight but keep the user's selection
+                self._last_query = None
+                self.table.restripe()
+            return
+
+        # Same query on an unchanged table: an explicit search re-selects the
+        # matches (the user may have clicked away) and moves to the next one;
+        # the debounced live search leaves the selection alone
+        if (query, self.table.revision) == self._last_query:
+            if cycle and self._last_matches:
+                self.table.tree.selection_add(self._last_matches)
+                self._match_pos = (self._match_pos + 1) % len(self._last_matches)
+                self.table.tree.see(self._last_matches[self._match_pos])
             return
 
         # Reset previous highlights
         self.reset_highlights()
-        # Check each cell in the row for a match
-        for iid in self.table.tree.get_children():
-            values = self.table.tree.item(iid, "values")
-            # Check if any cell contains the query (case insensitive)
-            if any(query in str(celda).lower() for celda in values):
-                # Add selection and make the row visible
-                self.table.tree.selection_add(iid)
-                self.table.tree.see(iid)
-                # Apply an tag to highlight the row
-                self.table.tree.item(iid, tags=("found",))
+        # Match against the table's precomputed lowercase row text
+        matches = self.table.find_rows(query)
+        self._last_query = (query, self.table.revision)
+        self._last_matches = matches
+        self._match_pos = 0
+        if matches:
+            # Select all matches at once and make the first one visible
+            self.table.tree.selection_add(matches)
+            self.table.tree.see(matches[0])
+            # Apply an tag to highlight the rows
+            for iid in matches:
+                self.table.tree.item(iid, tags=(self.table.tag_found,))
         # Configure the 'found' tag with a distinct background (e.g., yellow)
-        self.table.tree.tag_configure("found", background="#A1A15E")
+        self.table.tree.tag_configure(self.table.tag_found, background="#A1A15E")
     
     def reset_highlights(self):
         """Remove selection and restore zebra striping style."""
+        self._last_query = None
         self.table.tree.selection_remove(self.table.tree.selection())
-        for index, iid in enumerate(self.table.tree.get_children("")):
-            tag = self.table.tag_even if index % 2 == 0 else self.table.tag_odd
-            self.table.tree.item(iid, tags=(tag,))
+        self.table.restripe()
+
+    # ---------- Popup helpers ----------
+
+    @staticmethod
+    def _build_preview(frame, selected_rows):
+        """Read-only preview of the selected rows, filled with a single Text insert."""
+        preview = tk.Text(frame, height=8, wrap="none")
+        preview.pack(fill="both", expand=True, pady=(8, 8))
+        lines = [f"{'WO_ID':<14}{'DESCRIPTION':<42}STATE"]
+        lines += [
+            f"{str(r.get('wo_id', '')):<14}{str(r.get('description', ''))[:40]:<42}{r.get('state', '')}"
+            for r in selected_rows
+        ]
+        preview.insert("1.0", "\n".join(lines))
+        preview.configure(state="disabled")
+        return preview
 
     # ---------- Update State popup ----------
 
@@ -197,7 +414,7 @@ class AppStates(tk.Toplevel):
         popup.title("Update State")
         popup.geometry("600x440")
         popup.transient(self)
-        popup.iconbitmap(self.icon_path)
+        popup.iconbitmap(self._icon_path_str)
         popup.grab_set()
 
         frame = ttk.Frame(popup, padding=10)
@@ -208,15 +425,7 @@ class AppStates(tk.Toplevel):
         else:
             ttk.Label(frame, text=f"Selected rows: {len(selected_rows)}").pack(anchor="w")
 
-            cols = ("wo_id", "description", "state")
-            preview = ttk.Treeview(frame, columns=cols, show="headings", height=8)
-            for c in cols:
-                preview.heading(c, text=c.upper())
-                preview.column(c, width=180 if c != "state" else 120, anchor="w")
-            preview.pack(fill="both", expand=True, pady=(8, 8))
-
-            for r in selected_rows:
-                preview.insert("", "end", values=(r.get("wo_id", ""), r.get("description", ""), r.get("state", "")))
+            self._build_preview(frame, selected_rows)
 
             # State chooser
             form = ttk.Frame(frame)
@@ -258,28 +467,30 @@ class AppStates(tk.Toplevel):
                         messagebox.showerror("Invalid minutes", "Please enter a non-negative integer for minutes.")
                         return
 
-                # Apply locally and dispatch async server updates.
+                # Apply locally and dispatch async server updates in one batch.
+                updates = []
+                batch = []
+                known_ids = self.table.row_id_set()
                 for r in selected_rows:
                     wo_id = r.get("wo_id", "")
-                    if not wo_id or not self.table.has_row(wo_id):
+                    if not wo_id or wo_id not in known_ids:
                         continue
-                    self.table.set_state(wo_id, target_state)
-
-                    if target_state == "INPRG":
-                        if minutes > 0:
-                            self.table.set_cell(wo_id, "time_min", str(minutes))
-                            self.timers.start(wo_id, minutes)
-                        else:
-                            # INPRG without timer
-                            self.timers.cancel(wo_id)
-                            self.table.set_cell(wo_id, "time_min", "0")
+
+                    if target_state == "INPRG" and minutes > 0:
+                        self.timers.start(wo_id, minutes)
+                        updates.append((wo_id, target_state, minutes))
                     else:
+                        # WORKPENDING, or INPRG without timer
                         self.timers.cancel(wo_id)
-                        self.table.set_cell(wo_id, "time_min", "0")
+                        updates.append((wo_id, target_state, 0))
 
-                    # Fire-and-forget server update
-                    self.async_update_state_in_server(wo_id, target_state)
+                    # Fire-and-forget server update (sent with the batch below),
+                    # skipped when the row is already in the target state
+                    if r.get("state", "") != target_state:
+                        batch.append((wo_id, target_state))
 
+                self.table.apply_state_bulk(updates)
+                self.async_update_states_batch(batch)
                 popup.destroy()
 
             ttk.Button(btnbar, text="Apply", command=apply_changes).pack(side="left")
@@ -295,7 +506,7 @@ class AppStates(tk.Toplevel):
         popup.title("Add log")
         popup.geometry("700x650")
         popup.transient(self)
-        popup.iconbitmap(self.icon_path)
+        popup.iconbitmap(self._icon_path_str)
         popup.grab_set()
 
         frame = ttk.Frame(popup, padding=10)
@@ -306,15 +517,7 @@ class AppStates(tk.Toplevel):
         else:
             ttk.Label(frame, text=f"Selected rows: {len(selected_rows)}").pack(anchor="w")
 
-            cols = ("wo_id", "description", "state")
-            preview = ttk.Treeview(frame, columns=cols, show="headings", height=8)
-            for c in cols:
-                preview.heading(c, text=c.upper())
-                preview.column(c, width=180 if c != "state" else 120, anchor="w")
-            preview.pack(fill="both", expand=True, pady=(8, 8))
-
-            for r in selected_rows:
-                preview.insert("", "end", values=(r.get("wo_id", ""), r.get("description", ""), r.get("state", "")))
+            self._build_preview(frame, selected_rows)
 
             form = ttk.Frame(frame)
             form.pack(fill="x", pady=(10, 0))
@@ -322,27 +525,33 @@ class AppStates(tk.Toplevel):
             # log options functions
 
             def select_log(event):
+                title = title_var.get()
                 title_entry.delete("1.0", "end") # Clear current text
-                title_entry.insert("1.0", title_var.get()) # Insert selected log option
+                title_entry.insert("1.0", title) # Insert selected log option
                 note_text.delete("1.0", "end") # Clear note field
-                note_text.insert("1.0", "Please add additional details here...") # default text
-                if "N20." in title_var.get():
-                    note_text.delete("1.0", "end")
-                    note_text.insert("1.0", default_mw_text_1)
-                elif "N21." in title_var.get():
-                    note_text.delete("1.0", "end")
-                    note_text.insert("1.0", default_mw_text_2)
+                # Default text (MW templates for N20./N21.)
+                note_text.insert("1.0", LOG_ACTIONS.get(log_code(title), DEFAULT_LOG_ACTION)["default_note"])
 
             # Log title (from predefined options) + note
 
             # row 0
             ttk.Label(form, text="Title:").grid(row=0, column=0, sticky="w")
             title_var = tk.StringVar(value="")
-            title_options = ttk.Combobox(form, textvariable=title_var, values=log_options, state="readonly", width=60)
-            title_options.grid(row=0, column=1, sticky="w")
-            title_options.bind("<<ComboboxSelected>>", select_log) # Bind selection event
+            # One pre-filled combobox per language sharing title_var; the
+            # language toggle swaps which one is gridded instead of reloading values
+            title_options_en = ttk.Combobox(form, textvariable=title_var, values=log_options, state="readonly", width=60)
+            title_options_es = ttk.Combobox(form, textvariable=title_var, values=log_options_spanish, state="readonly", width=60)
+            for title_options in (title_options_en, title_options_es):
+                title_options.bind("<<ComboboxSelected>>", select_log) # Bind selection event
+            title_options_en.grid(row=0, column=1, sticky="w")
             set_spanish = tk.BooleanVar(value=False)
-            set_spanish_check = ttk.Checkbutton(form, text="Use Spanish log options", variable=set_spanish, command=lambda: title_options.configure(values=log_options_spanish if set_spanish.get() else log_options)) 
+
+            def toggle_language():
+                shown, hidden = (title_options_es, title_options_en) if set_spanish.get() else (title_options_en, title_options_es)
+                hidden.grid_remove()
+                shown.grid(row=0, column=1, sticky="w")
+
+            set_spanish_check = ttk.Checkbutton(form, text="Use Spanish log options", variable=set_spanish, command=toggle_language)
             set_spanish_check.grid(row=0, column=2, sticky="w")
             # row 1
             title_entry = tk.Text(form, width=50, height=1, wrap="word")
@@ -366,24 +575,29 @@ class AppStates(tk.Toplevel):
                     messagebox.showerror("Empty log", "Please provide a title or a note.")
                     return
 
+                # P00. also updates project_info, N27. also updates pm
+                action = LOG_ACTIONS.get(log_code(title), DEFAULT_LOG_ACTION)
+                project_info = note if action["column"] == "project_info" else None
+                pm = note if action["column"] == "pm" else None
+
                 # Optimistic UI update: apply to table immediately
+                updates = []
+                batch = []
+                known_ids = self.table.row_id_set()
                 for r in selected_rows:
                     wo_id = r.get("wo_id", "")
-                    if not wo_id or not self.table.has_row(wo_id):
+                    if not wo_id or wo_id not in known_ids:
                         continue
 
-                    # Async server update
-                    self.async_update_log_in_server(wo_id, title, note)
-                    # Update last_update column visually
-                    self.table.set_last_update(wo_id, note)
-                    # If P00. is in title, update project_info column too
-                    if 'P00.' in title:
-                        self.table.set_project_info(wo_id, note)
-                    # If N27. is in title, update pm column too
-                    if 'N27.' in title:
-                        self.table.set_pm(wo_id, note)
-                        
-                if 'N20.' in title or 'N21.' in title:
+                    # Async server update (sent with the batch below)
+                    batch.append((wo_id, title, note))
+                    # Update last_update (and project_info/pm) columns visually
+                    updates.append((wo_id, note, project_info, pm))
+
+                self.table.apply_log_bulk(updates)
+                self.async_update_logs_batch(batch)
+                if action["mw_email"]:
+                    from .mw_email_gen import generate_MW_email  # lazy: only needed for MW logs
                     generate_MW_email(note)
                 popup.destroy()
 
@@ -393,6 +607,7 @@ class AppStates(tk.Toplevel):
 
     # ---------- Export to Excel ----------
     def export_to_excel(self):
+        self.table.flush()  # the export reads the tree, so apply queued cell writes first
         export_treeview_to_excel(self.table.tree)
 
     # ---------- housekeeping ----------
@@ -407,10 +622,22 @@ class AppStates(tk.Toplevel):
             self.timers.cancel_all()
         except Exception:
             pass
+        if self._expiry_after_id:
+            self.after_cancel(self._expiry_after_id)
+            # Send expirations still waiting in the coalesce window
+            self._flush_expiries()
+        if self._reload_after_id:
+            self.after_cancel(self._reload_after_id)
+        if self._overflow_after_id:
+            self.after_cancel(self._overflow_after_id)
         try:
             self.executor.shutdown(wait=False, cancel_futures=True)
         except Exception:
             pass
+        try:
+            self.sccd.close()
+        except Exception:
+            pass
         self.destroy()
 
 def run_sccd_manager(owner: str, user_sccd: str, pass_sccd: str, on_close=None) -> None:
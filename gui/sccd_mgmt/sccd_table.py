@@ -8,13 +8,85 @@ sortable columns, double-click actions, zebra striping, and popup dialogs.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 import json
+import re
 
 from .utils import export_treeview_to_excel
 from ..components.utils import infoW
 from core import SCCD_LOC 
 
 
+# Backslash-escape everything Tcl would otherwise interpret inside a word
+_TCL_ESCAPES = str.maketrans({
+    "\\": "\\\\", "[": "\\[", "]": "\\]", "{": "\\{", "}": "\\}",
+    "$": "\\$", '"': '\\"', ";": "\\;", " ": "\\ ",
+    "\t": "\\t", "\n": "\\n", "\r": "\\r", "\v": "\\v", "\f": "\\f",
+    # tk.eval rejects a script with an embedded NUL; three octal digits so a
+    # following digit is not read as part of the escape
+    "\0": "\\000",
+})
+
+
+def _tcl_quote(value) -> str:
+    """Quote a value as a single Tcl word for use in a script passed to tk.eval."""
+    text = str(value)
+    return text.translate(_TCL_ESCAPES) if text else "{}"
+
+
+# Tcl proc that re-applies zebra tags by display position in one round-trip
+_RESTRIPE_PROC = """
+proc ::sccd_table_restripe {w even odd found} {
+    foreach t [list $found $even $odd] { $w tag remove $t }
+    set e {}; set o {}
+    foreach {a b} [$w children {}] {
+        lappend e $a
+        if {$b ne ""} { lappend o $b }
+    }
+    $w tag add $even $e
+    $w tag add $odd $o
+}
+"""
+
+
+# Fast path for the timestamp formats SCCD returns: YYYY-MM-DD or YYYY/MM/DD,
+# optionally followed by HH:MM[:SS]
+_DT_RE = re.compile(r"^(\d{4})[-/](\d{2})[-/](\d{2})(?:[ T](\d{2}):(\d{2})(?::(\d{2}))?)?$")
+
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d %H:%M",
+    "%Y/%m/%d",
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_str(s: str):
+    """Parse a datetime string, memoized: sorting re-parses the same timestamps."""
+    s = s.strip()
+    m = _DT_RE.match(s)
+    if m:
+        try:
+            return datetime(*map(int, m.groups(default="0")))
+        except ValueError:
+            return None  # matched the shape but not a real date/time
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
+    for f in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(s, f)
+        except ValueError:
+            continue
+    return None
+
+
 class Table(ttk.Frame):
     """
     Enhanced ttk.Treeview table:
@@ -36,6 +108,29 @@ class Table(ttk.Frame):
 
         # Store original rows keyed by iid (wo_id)
         self._row_store = {}
+        # iids of every row currently loaded (kept in sync by load/clear_view)
+        self._row_ids = set()
+        # Lowercased, space-joined displayed values keyed by iid (for search)
+        self._search_index = {}
+        # iids edited since their search text was built (rebuilt lazily on search)
+        self._stale_index = set()
+        # Bumped whenever rows, cell values or row order/tags change
+        self.revision = 0
+        # set_cell writes waiting for the idle flush, keyed by (iid, column)
+        self._pending_cells = {}
+        self._flush_cells_id = None
+        # Per-column [(sort key, iid), ...], reused until that column changes
+        self._sort_cache = {}
+        # Window used for copy feedback (Tk widgets cannot be re-parented)
+        self._toplevel = self.winfo_toplevel()
+        self._title_original = ""
+        self._title_restore_id = None
+
+        # Column name -> position, for O(1) column lookups
+        self._col_index = {c: i for i, c in enumerate(self.columns)}
+
+        # Per-column row -> display string formatters, selected once
+        self._formatters = {col: self._row_formatter(col) for col in self.columns}
 
         # Base heading text map (strip placeholders like ▲/▼)
         self._base_headings = {}
@@ -55,19 +150,27 @@ class Table(ttk.Frame):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        # Configure columns and headings
+        # Configure columns and headings (one Tcl script for all columns)
+        tree_w = self.tree._w
+        script = []
         for col in self.columns:
-            self.tree.heading(col, text=f"{self._base_headings[col]} ▲/▼",
-                              command=lambda c=col: self._sort_by(c, False))
+            command = self.tree.register(lambda c=col: self._sort_by(c, False))
             anchor = "e" if col in ("time_min", "cid_count") else "w"
             width = 200 if col in ("description", "last_update", "project_info") else 110
-            self.tree.column(col, width=width, anchor=anchor, stretch=True)
+            script.append(
+                f"{tree_w} heading {_tcl_quote(col)} "
+                f"-text {_tcl_quote(self._base_headings[col] + ' ▲/▼')} -command {command}"
+            )
+            script.append(f"{tree_w} column {_tcl_quote(col)} -width {width} -anchor {anchor} -stretch 1")
+        self.tree.tk.eval("\n".join(script))
 
         # Zebra tags
         self.tag_even = "evenrow"
         self.tag_odd = "oddrow"
+        self.tag_found = "found"  # search highlight, configured by the owner
         self.tree.tag_configure(self.tag_even, background="#717794") # zebra
         self.tree.tag_configure(self.tag_odd, background="#525768") # zebra
+        self.tree.tk.eval(_RESTRIPE_PROC)
 
         # Events
         self.tree.bind("<Double-1>", self._on_double_click)  # context-aware double click
@@ -84,12 +187,19 @@ class Table(ttk.Frame):
 
     # -------------------- Public API --------------------
 
-    def load(self, rows):
-        """Load data into the table from a list of dicts or sequences."""
+    def load(self, rows, *, take_ownership=False):
+        """Load data into the table from a list of dicts or sequences.
+        Dict rows are inserted with a single Tcl script instead of one call per row.
+        With take_ownership=True the dicts are stored as-is instead of copied;
+        the caller must not modify them afterwards.
+        """
         self._data = rows
         self.clear_view()
         print("Loading rows into table")
         is_dicts = len(rows) > 0 and isinstance(rows[0], dict)
+        tree_w = self.tree._w
+        formatters = list(self._formatters.values())
+        script = []
         for i, row in enumerate(rows):
             if is_dicts:
                 iid = row.get("wo_id", "")
@@ -97,23 +207,24 @@ class Table(ttk.Frame):
                     iid = self.tree.insert("", "end")
                     self.tree.delete(iid)
 
-                # derive cid_count from 'cids' list
-                cid_count = len(row.get("cids", []))
-                # build values for visible columns
-                vals = []
-                for col in self.columns:
-                    if col == "cid_count":
-                        vals.append(str(cid_count))
-                    else:
-                        vals.append(self._format_cell(col, row.get(col, "")))
+                # build values for visible columns (cid_count is derived from 'cids')
+                vals = [fmt(row) for fmt in formatters]
 
                 tag = self.tag_even if i % 2 == 0 else self.tag_odd # zebra
-                self.tree.insert("", "end", iid=iid, values=vals, tags=(tag,)) # zebra
-                self._row_store[iid] = row.copy()
+                script.append(
+                    f"{tree_w} insert {{}} end -id {_tcl_quote(iid)} "
+                    f"-values [list {' '.join(map(_tcl_quote, vals))}] -tags {tag}"
+                )
+                self._row_store[iid] = row if take_ownership else row.copy()
+                self._search_index[iid] = self._index_text(vals)
             else:
                 tag = self.tag_even if i % 2 == 0 else self.tag_odd # zebra
-                self.tree.insert("", "end", values=row, tags=(tag,)) # zebra
+                iid = self.tree.insert("", "end", values=row, tags=(tag,)) # zebra
+                self._search_index[iid] = self._index_text(row)
+            self._row_ids.add(iid)
 
+        if script:
+            self.tree.tk.eval("\n".join(script))
 
         # Reset sort indicators
         for col in self.columns:
@@ -121,12 +232,21 @@ class Table(ttk.Frame):
 
     def clear_view(self):
         """Clear rows from the view (does not touch external DB)."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._cancel_cell_flush()
+        self._pending_cells.clear()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
         self._row_store.clear()
+        self._row_ids.clear()
+        self._search_index.clear()
+        self._stale_index.clear()
+        self._sort_cache.clear()
+        self.revision += 1
 
     def get_selected(self):
         """Return a list of dicts {col: value} using displayed string values."""
+        self.flush()
         result = []
         for item in self.tree.selection():
             values = self.tree.item(item, "values")
@@ -135,6 +255,7 @@ class Table(ttk.Frame):
 
     def get_selected_full(self):
         """Return original stored rows (dicts) for selected iids if available."""
+        self.flush()
         full = []
         for iid in self.tree.selection():
             if iid in self._row_store:
@@ -145,20 +266,46 @@ class Table(ttk.Frame):
         return full
 
     def set_cell(self, wo_id: str, column: str, value: str):
-        """Set a single cell value in both view and row_store (if present)."""
+        """Set a single cell value in both view and row_store (if present).
+        View writes are coalesced and applied on the next idle pass (see flush).
+        """
         if not self.has_row(wo_id):
             return
-        values = list(self.tree.item(wo_id, "values"))
-        idx = self.columns.index(column)
-        if len(values) < len(self.columns):
-            values += [""] * (len(self.columns) - len(values))  # <-- fixed length calc
-        values[idx] = str(value)
-        self.tree.item(wo_id, values=values)
+        if column not in self._col_index:
+            # fail here, not inside the batched flush script
+            raise ValueError(f"Unknown column: {column!r}")
+        self._pending_cells[(wo_id, column)] = str(value)
+        self._sort_cache.pop(column, None)
+        if self._flush_cells_id is None:
+            self._flush_cells_id = self.after_idle(self.flush)
+        self._stale_index.add(wo_id)
+        self.revision += 1
 
         if wo_id in self._row_store:
             # keep underlying store coherent
             self._row_store[wo_id][column] = value
 
+    def flush(self):
+        """Write all pending set_cell values to the tree in one Tcl round-trip.
+        Call before reading cell values straight from self.tree.
+        """
+        self._cancel_cell_flush()
+        if not self._pending_cells:
+            return
+        tree_w = self.tree._w
+        script = "\n".join(
+            f"{tree_w} set {_tcl_quote(iid)} {_tcl_quote(col)} {_tcl_quote(val)}"
+            for (iid, col), val in self._pending_cells.items()
+        )
+        self._pending_cells.clear()
+        self.tree.tk.eval(script)
+
+    def _cancel_cell_flush(self):
+        """Drop the scheduled idle flush, if any."""
+        if self._flush_cells_id is not None:
+            self.after_cancel(self._flush_cells_id)
+            self._flush_cells_id = None
+
     def set_state(self, wo_id: str, new_state: str):
         """Update the 'state' column in the table/row_store."""
         self.set_cell(wo_id, "state", new_state)
@@ -174,9 +321,74 @@ class Table(ttk.Frame):
         """Update the 'pm' column in the table/row_store."""
         self.set_cell(wo_id, "pm", pm_info)
 
+    def apply_state_bulk(self, updates):
+        """Apply [(wo_id, state, minutes), ...] to the state and time_min columns in one pass.
+        Cells that already show the value are not rewritten.
+        Rows must exist in the table (callers filter beforehand).
+        """
+        self.flush()  # pending timer writes must not land after these
+        tree_set = self.tree.set
+        for wo_id, state, minutes in updates:
+            row = self._row_store.get(wo_id)
+            minutes = str(minutes)
+            changed = False
+            if row is None or row.get("state") != state:
+                tree_set(wo_id, "state", state)
+                changed = True
+            if row is None or str(row.get("time_min")) != minutes:
+                tree_set(wo_id, "time_min", minutes)
+                changed = True
+            if row is not None:
+                row["state"] = state
+                row["time_min"] = minutes
+            if changed:
+                self._stale_index.add(wo_id)
+                self.revision += 1
+                self._sort_cache.pop("state", None)
+                self._sort_cache.pop("time_min", None)
+
+    def apply_log_bulk(self, updates):
+        """Apply [(wo_id, last_update, project_info, pm), ...] in one pass.
+        project_info/pm set to None are left unchanged, as are cells that already
+        hold the value. Rows must exist in the table.
+        """
+        self.flush()  # pending timer writes must not land after these
+        tree_set = self.tree.set
+        for wo_id, last_update, project_info, pm in updates:
+            row = self._row_store.get(wo_id)
+            for column, value in (("last_update", last_update), ("project_info", project_info), ("pm", pm)):
+                if value is None or (row is not None and row.get(column) == value):
+                    continue
+                tree_set(wo_id, column, str(value))
+                self._sort_cache.pop(column, None)
+                if row is not None:
+                    row[column] = value
+            self._stale_index.add(wo_id)
+            self.revision += 1
+
     def has_row(self, wo_id: str) -> bool:
-        """Check if a row with the given wo_id exists in the table."""
-        return bool(self.tree.exists(wo_id))
+        """Check if a row with the given wo_id exists in the table (no Tcl call)."""
+        return wo_id in self._row_ids
+
+    def row_id_set(self) -> set:
+        """Return the set of loaded row iids (read-only; O(1) membership without Tcl)."""
+        return self._row_ids
+
+    def restripe(self):
+        """Re-apply zebra tags by display position and drop search highlights.
+        Runs entirely inside Tcl, so the whole pass is a single round-trip.
+        """
+        self.tree.tk.call("::sccd_table_restripe", self.tree._w,
+                          self.tag_even, self.tag_odd, self.tag_found)
+
+    def find_rows(self, query: str) -> list:
+        """Return iids whose displayed values contain the lowercase query."""
+        self.flush()
+        for iid in self._stale_index:
+            if iid in self._row_ids:
+                self._search_index[iid] = self._index_text(self.tree.item(iid, "values"))
+        self._stale_index.clear()
+        return [iid for iid, text in self._search_index.items() if query in text]
 
     # -------------------- Events & Sorting --------------------
 
@@ -203,6 +415,7 @@ class Table(ttk.Frame):
         column = self.columns[col_index]
         # Get underlying value (prefer original store)
         row = self._row_store.get(row_id)
+        self.flush()
         display_values = self.tree.item(row_id, "values")
         cell_value = (row.get(column) if row and column in row else display_values[col_index])
 
@@ -218,25 +431,31 @@ class Table(ttk.Frame):
             return
 
     def _sort_by(self, col, descending):
-        """Sort tree contents when a column header is clicked."""
-        data = []
-        for iid in self.tree.get_children(""):
-            val = self.tree.set(iid, col)
-            key = self._coerce_for_sort(col, val, iid)
-            data.append((key, iid))
-
-        data.sort(reverse=descending, key=lambda x: (self._is_none(x[0]), x[0]))
-
-        for index, (_, iid) in enumerate(data):
-            self.tree.move(iid, "", index)
-        
+        """Sort tree contents when a column header is clicked.
+        Keys come from the in-memory row store and are cached per column, so
+        toggling the direction only re-sorts. The new order is applied with a
+        single 'children' call instead of one move per row.
+        """
+        data = self._sort_cache.get(col)
+        if data is None:
+            self.flush()  # _display_value falls back to the tree for rows outside the store
+            data = []
+            for iid in self.tree.get_children(""):
+                val = self._display_value(iid, col)
+                key = self._coerce_for_sort(col, val, iid)
+                data.append(((self._is_none(key), key), iid))
+            self._sort_cache[col] = data
+
+        data.sort(reverse=descending, key=lambda x: x[0])
+
+        self.tree.set_children("", *(iid for _, iid in data))
+
         # Apply zebra style based on new position
-        for index, iid in enumerate(self.tree.get_children("")):
-            tag = self.tag_even if index % 2 == 0 else self.tag_odd # zebra
-            self.tree.item(iid, tags=(tag,)) # zebra
+        self.restripe()
 
         self._sort_state[col] = descending
         self._set_sort_indicators(active_col=col, descending=descending)
+        self.revision += 1
 
     def _set_sort_indicators(self, active_col, descending):
         """Update column headings to reflect current sort state."""
@@ -258,6 +477,9 @@ class Table(ttk.Frame):
 
     # -------------------- Popups --------------------
 
+    # Encoder fragments inserted per idle step in the info popup
+    INFO_CHUNK_PARTS = 256
+
     def _open_info_popup(self, iid, row, col_id):
         """Popup window showing detailed info for last_update or project_info."""
         popup = tk.Toplevel(self)
@@ -273,7 +495,7 @@ class Table(ttk.Frame):
                 payload = row["project_info"]
 
         popup.geometry("560x360")
-        popup.transient(self.winfo_toplevel())
+        popup.transient(self._toplevel)
         popup.grab_set()
 
         container = ttk.Frame(popup, padding=10)
@@ -281,22 +503,39 @@ class Table(ttk.Frame):
 
         text = tk.Text(container, wrap="word", height=14)
         text.pack(fill="both", expand=True)
-        try:
-            if isinstance(payload, (dict, list)):
-                rendered = json.dumps(payload, indent=2, ensure_ascii=False)
-            else:
-                rendered = str(payload)
-        except Exception:
-            rendered = str(payload)
-
-        text.insert("1.0", rendered)
         text.configure(state="disabled")
 
+        # Render lazily and insert in chunks so the first lines show at once
+        if isinstance(payload, (dict, list)):
+            chunks = json.JSONEncoder(indent=2, ensure_ascii=False, default=str).iterencode(payload)
+        else:
+            chunks = iter((str(payload),))
+        rendered = []
+
+        def insert(piece):
+            rendered.append(piece)
+            text.configure(state="normal")
+            text.insert("end", piece)
+            text.configure(state="disabled")
+
+        def pump():
+            if not text.winfo_exists():
+                return  # popup closed mid-render
+            piece = "".join(islice(chunks, self.INFO_CHUNK_PARTS))
+            if piece:
+                insert(piece)
+                self.after_idle(pump)
+
+        pump()
+
         btnbar = ttk.Frame(container)
         btnbar.pack(fill="x", pady=(8, 0))
 
         def copy_json():
-            self._copy_to_clipboard(rendered)
+            rest = "".join(chunks)  # finish rendering if still streaming
+            if rest:
+                insert(rest)
+            self._copy_to_clipboard("".join(rendered))
 
         ttk.Button(btnbar, text="Copy", command=copy_json).pack(side="left")
         ttk.Button(btnbar, text="Close", command=popup.destroy).pack(side="right")
@@ -309,7 +548,7 @@ class Table(ttk.Frame):
         popup = tk.Toplevel(self)
         popup.title(f"CIDs - {iid}")
         popup.geometry("600x360")
-        popup.transient(self.winfo_toplevel())
+        popup.transient(self._toplevel)
         popup.grab_set()
 
         container = ttk.Frame(popup, padding=10)
@@ -372,25 +611,53 @@ class Table(ttk.Frame):
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard with feedback in title bar."""
         try:
-            self.clipboard_clear()
-            self.clipboard_append(text)
-            top = self.winfo_toplevel()
-            original = top.title()
+            # Clear + append in a single Tcl round-trip
+            self.tk.eval(f"clipboard clear; clipboard append -- {_tcl_quote(text)}")
+            top = self._toplevel
+            if self._title_restore_id is None:
+                self._title_original = top.title()
+            else:
+                # A previous copy is still showing: keep its original title
+                self.after_cancel(self._title_restore_id)
             top.title(f"Copied: {text}")
-            top.after(900, lambda: top.title(original))
+            self._title_restore_id = self.after(900, self._restore_title)
         except Exception:
             messagebox.showinfo("Copied", text)
 
-    def _format_cell(self, col, value):
-        """Format cell value for display based on column type."""
-        if col == "last_update" or col == "project_info":
-            if isinstance(value, dict):
-                return value.get("title") or json.dumps(value, ensure_ascii=False)
-            return str(value)
-        if col in ("time_min", "cid_count"):
-            return str(value)
+    def _restore_title(self):
+        """Put back the window title replaced by _copy_to_clipboard."""
+        self._title_restore_id = None
+        self._toplevel.title(self._title_original)
+
+    @staticmethod
+    def _format_info(value):
+        """Format a last_update/project_info value (dict payloads show their title)."""
+        if isinstance(value, dict):
+            return value.get("title") or json.dumps(value, ensure_ascii=False)
         return str(value)
 
+    def _row_formatter(self, col):
+        """Return a callable mapping a stored row to the display string of col."""
+        if col == "cid_count":
+            return lambda row: str(len(row.get("cids", [])))
+        fmt = self._format_info if col in ("last_update", "project_info") else str
+        return lambda row: fmt(row.get(col, ""))
+
+    def _display_value(self, iid, col) -> str:
+        """Displayed value of a cell, read from the row store when available."""
+        row = self._row_store.get(iid)
+        if row is None:
+            return self.tree.set(iid, col)
+        return self._formatters[col](row)
+
+    @staticmethod
+    def _index_text(values) -> str:
+        """Build the lowercase search text for a row's displayed values.
+        Cells are joined with NUL, which a search query never contains, so a
+        match cannot span two cells.
+        """
+        return "\x00".join(str(v).lower() for v in values)
+
     @staticmethod
     def _is_none(v):
         """Helper to identify None values for sorting."""
@@ -441,27 +708,7 @@ class Table(ttk.Frame):
         """Parse a datetime string into a datetime object."""
         if not isinstance(s, str):
             return None
-        s = s.strip()
-        fmts = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d",
-            "%Y/%m/%d %H:%M:%S",
-            "%Y/%m/%d %H:%M",
-            "%Y/%m/%d",
-        ]
-        try:
-            from datetime import datetime as _dt
-            return _dt.fromisoformat(s)
-        except Exception:
-            pass
-        from datetime import datetime as _dt
-        for f in fmts:
-            try:
-                return _dt.strptime(s, f)
-            except Exception:
-                continue
-        return None
+        return _parse_datetime_str(s)
     
     # -------------------- Location Fetcher for CIDs --------------------
     def _get_exact_location(self, headers: list, rows: list[tuple], wo_id: str) -> tuple[list, list]:
@@ -5,9 +5,56 @@ This module provides utility functions for the SCCD Manager interface,
 including Excel export functionality and time parsing helpers.
 """
 
+from itertools import chain, islice
+from typing import Iterator
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import pandas as pd
+
+
+# Tcl lambda returning the values of every top-level row of a Treeview
+_ROWS_LAMBDA = "w {set r {}; foreach i [$w children {}] {lappend r [$w item $i -values]}; return $r}"
+
+
+def _fast_treeview_rows(tree: ttk.Treeview) -> Iterator[tuple]:
+    """
+    Yield the values tuple of each top-level Treeview row, in display order.
+
+    All rows are fetched with a single Tcl call instead of one
+    children + item round-trip per row; rows are split lazily.
+    """
+    splitlist = tree.tk.splitlist
+    for values in splitlist(tree.tk.call("apply", _ROWS_LAMBDA, tree._w)):
+        yield splitlist(values)
+
+
+# Rows per worksheet; larger exports continue on data_2, data_3, ...
+# (well below Excel's 1,048,576-row sheet limit)
+EXPORT_SHEET_ROWS = 250_000
+
+
+def _write_sheets(workbook, headers, rows) -> None:
+    """Write headers + rows, starting a new worksheet every EXPORT_SHEET_ROWS rows."""
+    rows = iter(rows)
+    sheet_no = 0
+    while True:
+        chunk = islice(rows, EXPORT_SHEET_ROWS)
+        first = next(chunk, None)
+        if first is None and sheet_no:
+            return
+        sheet_no += 1
+        worksheet = workbook.add_worksheet("data" if sheet_no == 1 else f"data_{sheet_no}")
+        worksheet.write_row(0, 0, headers)
+        if first is None:
+            return  # no rows at all: headers only
+        write_string = worksheet.write_string
+        write = worksheet.write
+        for i, row in enumerate(chain((first,), chunk), 1):
+            for j, value in enumerate(row):
+                # Treeview values are strings; anything else goes through write()
+                if isinstance(value, str):
+                    write_string(i, j, value)
+                else:
+                    write(i, j, value)
 
 
 def export_treeview_to_excel(tree: ttk.Treeview, callback=None, callback_args=None) -> None:
@@ -23,15 +70,14 @@ def export_treeview_to_excel(tree: ttk.Treeview, callback=None, callback_args=No
     """
     # 1) Get column headers
     cols = list(tree["columns"])
-    headers = [tree.heading(c)["text"].lower() or c for c in cols]
+    # Query only -text (tree.heading(c) builds a dict of every heading option)
+    headers = [str(tree.tk.call(tree._w, "heading", c, "-text")).lower() or c for c in cols]
 
-    # 2) Get row data
-    rows = []
-    for iid in tree.get_children(""):
-        values = tree.item(iid, "values")
-        rows.append(values)
+    # 2) Get row data (streamed; peek the first row to detect an empty tree)
+    rows = _fast_treeview_rows(tree)
+    first = next(rows, None)
 
-    if not rows:
+    if first is None:
         messagebox.showwarning("Export to Excel", "The Treeview has no data.")
         return
 
@@ -39,14 +85,12 @@ def export_treeview_to_excel(tree: ttk.Treeview, callback=None, callback_args=No
     new_headers = None
     new_rows = None
     if callback:
-        new_headers, new_rows = callback(headers, rows, callback_args if callback_args else None)
+        # Callbacks receive a list, as they may iterate the rows more than once
+        new_headers, new_rows = callback(headers, [first, *rows], callback_args if callback_args else None)
     else:
-        new_headers, new_rows = headers, rows
-
-    # 3) Create DataFrame
-    df = pd.DataFrame(new_rows, columns=new_headers)
+        new_headers, new_rows = headers, chain((first,), rows)
 
-    # 4) Save file dialog
+    # 3) Save file dialog
     filepath = filedialog.asksaveasfilename(
         title="Save as",
         defaultextension=".xlsx",
@@ -57,11 +101,28 @@ def export_treeview_to_excel(tree: ttk.Treeview, callback=None, callback_args=No
     if not filepath:
         return
 
+    # Freeze the tree while writing: flush pending redraws (e.g. under the closed
+    # dialog) once, then block selection changes and show a busy cursor
+    tree.update_idletasks()
+    old_selectmode, old_cursor = tree.cget("selectmode"), tree.cget("cursor")
+    tree.configure(selectmode="none", cursor="watch")
     try:
-        df.to_excel(filepath, index=False)
-        messagebox.showinfo("Export to Excel", f"File saved:\n{filepath}")
+        try:
+            import xlsxwriter  # lazy: only needed when exporting
+
+            # 4) Write rows directly with xlsxwriter (no DataFrame); constant_memory
+            # streams each row to disk instead of keeping the workbook in memory
+            workbook = xlsxwriter.Workbook(filepath, {"constant_memory": True})
+            try:
+                _write_sheets(workbook, new_headers, new_rows)
+            finally:
+                workbook.close()
+        finally:
+            tree.configure(selectmode=old_selectmode, cursor=old_cursor)
+        # Show the result once Tk has finished redrawing after the export
+        tree.after_idle(messagebox.showinfo, "Export to Excel", f"File saved:\n{filepath}")
     except Exception as e:
-        messagebox.showerror("Error", f"Could not export file.\n{e}")
+        tree.after_idle(messagebox.showerror, "Error", f"Could not export file.\n{e}")
 
 
 def parse_minutes(entry: str) -> int:
@@ -78,11 +139,8 @@ def parse_minutes(entry: str) -> int:
         ValueError: If the entry format is invalid
     """
     try:
-        if ":" in entry:  # hh:mm format
-            hh, mm = entry.split(":")
-            total_minutes = int(hh) * 60 + int(mm)
-            return total_minutes
-        else:  # plain minutes
-            return int(entry)
+        # Single scan: sep is ":" for hh:mm, "" for plain minutes
+        hh, sep, mm = entry.partition(":")
+        return int(hh) * 60 + int(mm) if sep else int(hh)
     except ValueError:
-        raise ValueError(f"Invalid format: {entry}. Use 'hh:mm' or minutes as a number.")
\ No newline at end of file
+        raise ValueError(f"Invalid format: {entry}. Use 'hh:mm' or minutes as a number.")
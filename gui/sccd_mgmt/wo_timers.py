@@ -3,23 +3,26 @@
 wo_timers.py
 -------------
 Manages countdown timers for Work Orders, updating a Tkinter-based table.
-All GUI updates are executed via Tk 'after' callbacks to remain in the main thread.
+All timer state and GUI updates live on the Tk thread: ticks are Tk 'after'
+callbacks, and public calls from other threads are re-posted to the Tk loop.
 """
 from __future__ import annotations
 import threading
 from dataclasses import dataclass
 from typing import Dict, Optional, Callable
 
-@dataclass
+@dataclass(slots=True)
 class _TimerCtx:
     wo_id: str
     remaining_seconds: int
-    after_id: Optional[str] = None
+    last_minutes: int = -1  # minutes last written to the table
 
 class WorkOrderTimers:
     """Manage multiple per-WO countdown timers using Tk's 'after'.
     - No threads are used for the countdown itself; everything runs through .after().
-    - Thread-safe stop/start via a lock if external threads request timer changes.
+    - A single 1 s tick advances every active timer, however many are running.
+    - Thread-safe start/cancel: calls from other threads are re-posted with
+      after(0, ...), so timer state is only ever touched on the Tk thread (no lock).
     """
     def __init__(self, tk_root, table_adapter, on_expire: Optional[Callable[[str], None]] = None):
         """
@@ -35,85 +38,97 @@ class WorkOrderTimers:
         self.table = table_adapter
         self.on_expire = on_expire
         self._timers: Dict[str, _TimerCtx] = {}
-        self._lock = threading.Lock()
+        # "The Tk thread": the thread that created the timers (and runs mainloop)
+        self._tk_tid = threading.get_ident()
+        self._global_after: Optional[str] = None
 
     def start(self, wo_id: str, minutes: int):
         """Start or restart a timer for a WO.
         If a timer already exists, it is cancelled and restarted.
         """
+        if not self._on_tk_thread():
+            self.root.after(0, self.start, wo_id, minutes)
+            return
         seconds = max(0, int(minutes)) * 60
-        with self._lock:
-            self._cancel_locked(wo_id)
-            ctx = _TimerCtx(wo_id=wo_id, remaining_seconds=seconds)
-            self._timers[wo_id] = ctx
+        self._cancel_timer(wo_id)
+        ctx = _TimerCtx(wo_id=wo_id, remaining_seconds=seconds)
+        self._timers[wo_id] = ctx
         # Set initial visual time (in minutes)
-        self._update_time_visual(wo_id, seconds)
-        self._schedule_tick(wo_id)
+        self._update_time_visual(ctx)
+        self._ensure_running()
 
     def cancel(self, wo_id: str):
         """Cancel an active timer (if any) for the given WO."""
-        with self._lock:
-            self._cancel_locked(wo_id)
-
-        # Reset the visual time to 0 in GUI thread
-        self.root.after(0, lambda: self.table.set_cell(wo_id, "time_min", "0"))
+        if not self._on_tk_thread():
+            self.root.after(0, self.cancel, wo_id)
+            return
+        if self._cancel_timer(wo_id):
+            # Reset the visual time to 0 (rows without a timer already show it)
+            self.table.set_cell(wo_id, "time_min", "0")
 
     def cancel_all(self):
         """Cancel all timers (used by Clear/reset)."""
-        with self._lock:
-            for wid in list(self._timers.keys()):
-                self._cancel_locked(wid)
-            self._timers.clear()
-
-    # ---------------- internal ----------------
-
-    def _cancel_locked(self, wo_id: str):
-        ctx = self._timers.get(wo_id)
-        if not ctx:
+        if not self._on_tk_thread():
+            self.root.after(0, self.cancel_all)
             return
-        if ctx.after_id is not None:
+        self._timers.clear()
+        if self._global_after is not None:
             try:
-                self.root.after_cancel(ctx.after_id)
+                self.root.after_cancel(self._global_after)
             except Exception:
                 pass
-        self._timers.pop(wo_id, None)
+            self._global_after = None
 
-    def _schedule_tick(self, wo_id: str):
-        with self._lock:
-            ctx = self._timers.get(wo_id)
-            if not ctx:
-                return  # cancelled
-            # Schedule next tick (1s) in the mainloop
-            ctx.after_id = self.root.after(1000, lambda: self._tick(wo_id))
+    # ---------------- internal ----------------
+
+    def _on_tk_thread(self) -> bool:
+        """True when called from the Tk thread that owns the timers."""
+        return threading.get_ident() == self._tk_tid
 
-    def _tick(self, wo_id: str):
-        with self._lock:
-            ctx = self._timers.get(wo_id)
-            if not ctx:
-                return  # cancelled
+    def _cancel_timer(self, wo_id: str) -> bool:
+        """Drop the timer for wo_id; return True if one was running."""
+        # The global tick stops by itself once no timers are left
+        return self._timers.pop(wo_id, None) is not None
 
+    def _ensure_running(self):
+        """Schedule the global tick if timers are active and none is pending."""
+        if not self._timers or self._global_after is not None:
+            return
+        # Schedule next tick (1s) in the mainloop
+        self._global_after = self.root.after(1000, self._global_tick)
+
+    def _global_tick(self):
+        """Advance every active timer by one second."""
+        updates = []
+        expired = []
+        self._global_after = None
+        for wo_id, ctx in self._timers.items():
             # Decrease time
             ctx.remaining_seconds = max(0, ctx.remaining_seconds - 1)
-            seconds = ctx.remaining_seconds
-
-        # Update the GUI (main thread, via after)
-        self._update_time_visual(wo_id, seconds)
-
-        if seconds <= 0:
-            # Expired: set state to WORKPENDING and cancel
-            self.root.after(0, lambda: self.table.set_state(wo_id, "WORKPENDING"))
+            updates.append(ctx)
+            if ctx.remaining_seconds <= 0:
+                expired.append(wo_id)
+        for wo_id in expired:
+            self._cancel_timer(wo_id)
+
+        # Update the GUI after the pass (callbacks may start/cancel timers)
+        for ctx in updates:
+            self._update_time_visual(ctx)
+
+        for wo_id in expired:
+            # Expired: set state to WORKPENDING
+            self.table.set_state(wo_id, "WORKPENDING")
             # optional hook for server-side update, logging, etc.
             if self.on_expire:
                 self.on_expire(wo_id)
-            # Remove from dict in a locked section
-            with self._lock:
-                self._cancel_locked(wo_id)
-            return
 
-        # schedule next second
-        self._schedule_tick(wo_id)
+        # schedule next second (only while timers remain)
+        self._ensure_running()
 
-    def _update_time_visual(self, wo_id: str, seconds: int):
+    def _update_time_visual(self, ctx: _TimerCtx):
         # Convert seconds to remaining minutes (rounded up; so user sees "counting down")
-        minutes = (seconds + 59) // 60  # ceiling to next minute
-        self.root.after(0, lambda: self.table.set_cell(wo_id, "time_min", str(minutes)))
+        minutes = (ctx.remaining_seconds + 59) // 60  # ceiling to next minute
+        if minutes == ctx.last_minutes:
+            return  # displayed value unchanged (59 of every 60 ticks)
+        ctx.last_minutes = minutes
+        self.table.set_cell(ctx.wo_id, "time_min", str(minutes))
@@ -12,7 +12,7 @@ from .components import error_window, save_excel, select_client
 from core import get_meraki_switches, get_org
 
 
-def get_atp_button_function(meraki_key_api: str) -> None:
+def get_atp_button_function(meraki_key_api: str, root_win=None) -> None:
     """
     Retrieve ATP information from Meraki switches and save to Excel.
 
@@ -21,6 +21,7 @@ def get_atp_button_function(meraki_key_api: str) -> None:
 
     Args:
         meraki_key_api: Meraki API key for authentication
+        root_win: Optional widget used to defer the error dialog until Tk is idle
     """
     try:
         clients = get_org(meraki_key_api)  # Get list of organizations
@@ -29,7 +30,10 @@ def get_atp_button_function(meraki_key_api: str) -> None:
         save_excel(info)  # Save information to Excel file
         print("File saved")
     except Exception as e:
-        error_window(f"Error: {e}")
+        if root_win is not None:
+            root_win.after_idle(error_window, f"Error: {e}")
+        else:
+            error_window(f"Error: {e}")
 
 
 def main_function(root_win, meraki_key_api: str) -> None:
@@ -46,6 +50,6 @@ def main_function(root_win, meraki_key_api: str) -> None:
     btn_funcion1 = ttk.Button(
         root_win,
         text='Get ATP SW Meraki',
-        command=lambda: get_atp_button_function(meraki_key_api)
+        command=lambda: get_atp_button_function(meraki_key_api, root_win)
     )
     btn_funcion1.pack(pady=20)
\ No newline at end of file
@@ -11,9 +11,10 @@ import os
 import tkinter
 from tkinter import ttk
 
-from passlib.context import CryptContext
 import dotenv
 
+from gui.components.password_hashing import HASH_CONTEXT
+
 
 class AuthenticatedUser:
     """
@@ -23,16 +24,18 @@ class AuthenticatedUser:
     against a hashed secret, and tracks authentication state.
     """
 
+    BACKOFF_BASE_MS = 100  # Delay after a failed attempt: BACKOFF_BASE_MS * 4**attempts
+
     def __init__(self):
         self.passw = ""  # Stores the application password, not the SCCD password
         self.authenticated = False
         self.attempts = 0  # Number of authentication attempts in the application
-        self.__hash_context = CryptContext(
-            schemes=["pbkdf2_sha256"],
-            default="pbkdf2_sha256",
-            pbkdf2_sha256__default_rounds=5000)  # Used for password hashing
+        # Used for password verification (shared with EnvHandler.create_password)
+        self.__hash_context = HASH_CONTEXT
         self.__env_path = Path('.') / '.env'
         dotenv.load_dotenv(dotenv_path=self.__env_path)
+        # Stored password hash, read once (None if not configured yet)
+        self._hash_pass = os.environ.get("SECRET_KEY_HASH")
         self.icon_path = Path(__file__).resolve().parent / \
             'resources' / 'icon.ico'
 
@@ -44,11 +47,15 @@ class AuthenticatedUser:
         Returns:
             bool: True if the password is correct, False otherwise.
         """
-        hash_pass = os.environ["SECRET_KEY_HASH"]
-        if self.__hash_context.verify(passw, hash_pass):
-            return True
-        else:
-            return False
+        if self._hash_pass is None:
+            self._hash_pass = os.environ["SECRET_KEY_HASH"]
+        valid, new_hash = self.__hash_context.verify_and_update(passw, self._hash_pass)
+        if valid and new_hash is not None:
+            # Legacy pbkdf2_sha256 hash: replace it with an argon2id one in .env
+            dotenv.set_key(self.__env_path, 'SECRET_KEY_HASH', new_hash)
+            os.environ["SECRET_KEY_HASH"] = new_hash
+            self._hash_pass = new_hash
+        return valid
 
     def request_authent(self):
         """
@@ -64,7 +71,15 @@ class AuthenticatedUser:
                 if not self.authenticated:
                     self.attempts += 1
                     ent_password.delete(0, tkinter.END)
+                    btn_cont.configure(state="disabled")
+                    if self.attempts >= 5:
+                        # Out of attempts: no point in waiting for the button
+                        lbl_state.configure(text="Too many tries")
+                        return
                     lbl_state.configure(text="Try again")
+                    # Exponential backoff between attempts (400 ms, 1.6 s, 6.4 s, ...)
+                    auth_win.after(self.BACKOFF_BASE_MS * (4 ** self.attempts),
+                                   lambda: btn_cont.configure(state="normal"))
                 else:
                     auth_win.destroy()
             else: